@@ -9,8 +9,8 @@ Note:
     While most of these are universal on all modern terminals, there might
     be some that don't always work. I'll try to mark these separately.
 
-    Also, using the escape sequence for save/restore of terminal doesn't work,
-    only tput does. We should look into that.
+    Saving & restoring the screen uses the alternate screen buffer sequences,
+    the same ones `tput smcup` & `tput rmcup` emit on xterm-compatible terminals.
 
 Credits:
     - https://wiki.bash-hackers.org/scripting/terminalcodes
@@ -23,13 +23,14 @@ import re
 import sys
 import signal
 
-from typing import Optional, Any, Union, Callable
+from typing import Optional, Any, Union, Callable, Generator, IO
+from functools import lru_cache
+from contextlib import contextmanager
 from dataclasses import dataclass, fields
 from enum import Enum, auto as _auto
 from sys import stdout as _stdout
 from string import hexdigits
-from subprocess import run as _run, Popen as _Popen
-from os import name as _name, get_terminal_size, system
+from os import name as _name, get_terminal_size, system, write as _os_write
 
 from .input import getch
 
@@ -39,6 +40,9 @@ __all__ = [
     "background",
     "terminal",
     "is_interactive",
+    "write",
+    "flush",
+    "batched",
     "save_screen",
     "restore_screen",
     "set_alt_buffer",
@@ -77,6 +81,77 @@ __all__ = [
     "strikethrough",
 ]
 
+_CLEAR = {
+    "eos": "\x1b[0J",
+    "bos": "\x1b[1J",
+    "screen": "\x1b[2J",
+    "eol": "\x1b[0K",
+    "bol": "\x1b[1K",
+    "line": "\x1b[2K",
+}
+
+_MODE_OPTIONS = {
+    "reset": 0,
+    "bold": 1,
+    "dim": 2,
+    "italic": 3,
+    "underline": 4,
+    "blink": 5,
+    "inverse": 7,
+    "invisible": 8,
+    "strikethrough": 9,
+}
+
+# Modes can be given by their name, their number or the number as a string.
+_MODE_CODES: dict[Union[str, int], str] = {
+    key: f"\x1b[{value}m"
+    for name, value in _MODE_OPTIONS.items()
+    for key in (name, value, str(value))
+}
+
+
+def _mode_code(mode: Union[str, int]) -> str:
+    """Get the sequence of a display mode without writing it
+
+    See `help(set_mode)` for the available options."""
+
+    code = _MODE_CODES.get(mode)
+    if code is not None:
+        return code
+
+    if not isinstance(mode, int) and not mode.isdigit():
+        mode = _MODE_OPTIONS[mode]
+
+    return f"\x1b[{mode}m"
+
+
+_RE_CURSOR_REPORT = re.compile(r"\x1b\[(\d+);(\d+)R")
+
+_RESET = _mode_code("reset")
+_BOLD = _mode_code("bold")
+_DIM = _mode_code("dim")
+_ITALIC = _mode_code("italic")
+_UNDERLINE = _mode_code("underline")
+_BLINK = _mode_code("blink")
+_INVERSE = _mode_code("inverse")
+_INVISIBLE = _mode_code("invisible")
+_STRIKETHROUGH = _mode_code("strikethrough")
+
+
+def _get_cursor_moves(code: str) -> dict[int, str]:
+    """Precompute cursor movement sequences of `code` for the common distances"""
+
+    return {num: f"\x1b[{num}{code}" for num in range(64)}
+
+
+_CURSOR_UP = _get_cursor_moves("A")
+_CURSOR_DOWN = _get_cursor_moves("B")
+_CURSOR_RIGHT = _get_cursor_moves("C")
+_CURSOR_LEFT = _get_cursor_moves("D")
+_CURSOR_NEXT_LINE = _get_cursor_moves("E")
+_CURSOR_PREV_LINE = _get_cursor_moves("F")
+_CURSOR_COLUMN = _get_cursor_moves("G")
+
 
 class _Color:
     """Base color object"""
@@ -109,20 +184,33 @@ class _Color:
         }
 
         self.layer_offset = layer * 10
+        self._indexed_prefix = f"\x1b[{38 + self.layer_offset};5;"
+        self._rgb_prefix = f"\x1b[{38 + self.layer_offset};2;"
+
+        # Prefixes of all 8-bit colors, indexable by int or digit string. Names
+        # are left out, as `names` can be changed at any time.
+        self._cache: dict[Union[int, str], str] = {}
+        for index in range(256):
+            prefix = f"{self._indexed_prefix}{index}m"
+            self._cache[index] = self._cache[str(index)] = prefix
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def translate_hex(color: str) -> tuple[int, int, int]:
         """Translate hex string to rgb values"""
 
         if color.startswith("#"):
             color = color[1:]
 
-        rgb = []
-        for i in (0, 2, 4):
-            color_hex = color[i : i + 2]
-            rgb.append(int(color_hex, 16))
+        # Short strings are parsed per channel, which raises ValueError on an
+        # empty one.
+        if len(color) < 6:
+            red, green, blue = (int(color[i : i + 2], 16) for i in (0, 2, 4))
+            return red, green, blue
 
-        return rgb[0], rgb[1], rgb[2]
+        # Anything past the first 6 digits is ignored
+        value = int(color[:6], 16)
+        return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
 
     def __call__(
         self,
@@ -134,6 +222,45 @@ class _Color:
     ) -> str:
         """Return colored text with reset code at the end"""
 
+        prefix = self._cache.get(color)  # type: ignore
+        if prefix is None:
+            if color in self.names:
+                prefix = self._get_named_prefix(color)  # type: ignore
+            else:
+                prefix = self._get_prefix(color)
+
+        return prefix + text + (_RESET if reset_color else "")
+
+    def _get_named_prefix(self, name: str) -> str:
+        """Get the sequence setting a color from `names`"""
+
+        # Names made of hex digits are still read as hex colors first
+        if all(char in hexdigits or char == "#" for char in name):
+            try:
+                red, green, blue = self.translate_hex(name)
+                return f"{self._rgb_prefix}{red};{green};{blue}m"
+            except ValueError:
+                pass
+
+        index = self.names[name]
+        assert isinstance(index, int)
+
+        prefix = self._cache.get(index)
+        if prefix is None:
+            prefix = f"{self._indexed_prefix}{index}m"
+
+        return prefix
+
+    # 24-bit colors can't be tabled up-front, so they are cached as they are used.
+    @lru_cache(maxsize=1024)
+    def _get_prefix(
+        self,
+        color: Union[
+            int, str, tuple[Union[int, str], Union[int, str], Union[int, str]]
+        ],
+    ) -> str:
+        """Get the sequence setting a color not found in the cache"""
+
         # convert hex string to tuple[int, int, int]
         if isinstance(color, str) and all(
             char in hexdigits or char == "#" for char in color
@@ -144,30 +271,17 @@ class _Color:
                 # value is not a hex number, but is string
                 pass
 
-        if color in self.names:
-            new = self.names[str(color)]
-            assert isinstance(new, int)
-            color = new
-
         # rgb values
         if isinstance(color, tuple):
             red, green, blue = color
-            color_value = f"2;{red};{green};{blue}m"
+            return f"{self._rgb_prefix}{red};{green};{blue}m"
 
-        # 8-bit colors (including 0-16)
-        elif isinstance(color, int) or color.isdigit():
-            color_value = f"5;{color}m"
+        # 8-bit colors outside of the cached ones
+        if isinstance(color, int) or color.isdigit():
+            return f"{self._indexed_prefix}{color}m"
 
-        else:
-            raise NotImplementedError(
-                f"Not sure what to do with {color} of type {type(color)}"
-            )
-
-        return (
-            f"\x1b[{38 + self.layer_offset};"
-            + color_value
-            + text
-            + (set_mode("reset") if reset_color else "")
+        raise NotImplementedError(
+            f"Not sure what to do with {color} of type {type(color)}"
         )
 
 
@@ -175,7 +289,7 @@ foreground = _Color()
 background = _Color(layer=1)
 
 
-def screen_size() -> tuple[int, int]:
+def _query_screen_size() -> tuple[int, int]:
     """Get screen size using os module
 
     This is technically possible using a method of
@@ -195,6 +309,17 @@ def screen_size() -> tuple[int, int]:
         return 0, 0
 
 
+_screen_size = _query_screen_size()
+
+
+def screen_size() -> tuple[int, int]:
+    """Get screen size
+
+    The value is cached, and refreshed by `terminal` on every SIGWINCH."""
+
+    return _screen_size
+
+
 class _Terminal:
     """A class to store & access data about a terminal"""
 
@@ -207,6 +332,9 @@ class _Terminal:
         self.size: tuple[int, int] = self._get_size()
         self._listeners: dict[int, list[Callable[..., Any]]] = {}
 
+        # Incremented by every `clear()`, so printers know the screen is stale
+        self.clear_count = 0
+
         signal.signal(signal.SIGWINCH, self._update_size)
 
     def _call_listener(self, event: int, data: Any) -> None:
@@ -225,6 +353,9 @@ class _Terminal:
     def _update_size(self, *_: Any) -> None:
         """Update screen size at SIGWINCH"""
 
+        global _screen_size  # pylint: disable=global-statement, invalid-name
+
+        _screen_size = _query_screen_size()
         self.size = self._get_size()
         self._call_listener(self.RESIZE, self.size)
 
@@ -248,7 +379,9 @@ class _Terminal:
 
         self._listeners[event].append(callback)
 
-    def fill(self, color: int = 0, flush: bool = True) -> None:
+    def fill(
+        self, color: int = 0, flush: bool = True  # pylint: disable=redefined-outer-name
+    ) -> None:
         """Fill entire terminal with color"""
 
         for height in range(self.height):
@@ -262,20 +395,113 @@ class _Terminal:
 
 terminal = _Terminal()
 
+
+def _get_tty_fd() -> Optional[int]:
+    """Get the file descriptor of stdout if it is a terminal"""
+
+    try:
+        if _stdout.isatty():
+            return _stdout.fileno()
+
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    return None
+
+
+# Sequences written while inside `batched()` are collected here,
+# and written to stdout in a single call once the batch ends.
+_OUT_BUF: list[str] = []
+_batch_depth = 0
+
+# Batches written to a terminal skip Python's IO stack
+_TTY_FD = _get_tty_fd()
+
+# Otherwise they still skip the text layer, when stdout has a binary one
+_STDOUT_BUFFER: Optional[IO[bytes]] = getattr(_stdout, "buffer", None)
+
 # helpers
-def _tput(command: list[str]) -> None:
-    """Shorthand for tput calls"""
+def _write(code: str) -> None:
+    """Write code to stdout, or to the output buffer while batching"""
+
+    if _batch_depth > 0:
+        _OUT_BUF.append(code)
+        return
+
+    _stdout.write(code)
+
+
+def _write_raw(data: bytes) -> None:
+    """Write data directly to the terminal's file descriptor"""
+
+    assert _TTY_FD is not None
+
+    view = memoryview(data)
+    while len(view) > 0:
+        view = view[_os_write(_TTY_FD, view) :]
+
+
+def write(text: str) -> None:
+    """Write text as-is, to stdout or to the output buffer while batching"""
+
+    _write(text)
+
+
+def flush() -> None:
+    """Write all buffered output to stdout in a single call, and flush it"""
 
-    waited_commands = ["clear", "smcup", "cup"]
+    # Anything written through the text layer has to go out first
+    _stdout.flush()
+
+    if len(_OUT_BUF) == 0:
+        return
 
-    command.insert(0, "tput")
-    str_command = [str(c) for c in command]
+    text = "".join(_OUT_BUF)
+    _OUT_BUF.clear()
 
-    if command[1] in waited_commands:
-        _run(str_command, check=True)
+    if _TTY_FD is None and _STDOUT_BUFFER is None:
+        _stdout.write(text)
+        _stdout.flush()
         return
 
-    _Popen(str_command)
+    # The whole batch is encoded at once, rather than per sequence
+    data = text.encode(_stdout.encoding, _stdout.errors)
+
+    if _TTY_FD is not None:
+        _write_raw(data)
+        return
+
+    assert _STDOUT_BUFFER is not None
+    _STDOUT_BUFFER.write(data)
+    _STDOUT_BUFFER.flush()
+
+
+@contextmanager
+def batched() -> Generator[None, None, None]:
+    """Collect all output within the block, write it on exit.
+
+    Batches can be nested, the output is only written once the outermost
+    one ends.
+
+    Example:
+        >>> from pytermgui import batched, move_cursor, clear
+        >>> with batched():
+        ...     clear()
+        ...     move_cursor((10, 10))
+    """
+
+    global _batch_depth  # pylint: disable=global-statement
+
+    _batch_depth += 1
+
+    try:
+        yield
+
+    finally:
+        _batch_depth -= 1
+
+        if _batch_depth == 0:
+            flush()
 
 
 def is_interactive() -> bool:
@@ -289,16 +515,14 @@ def save_screen() -> None:
     """Save the contents of the screen, wipe.
     Use `restore_screen()` to get them back."""
 
-    # print("\x1b[?47h")
-    _tput(["smcup"])
+    _write("\x1b[?1049h")
 
 
 def restore_screen() -> None:
     """Restore the contents of the screen,
     previously saved by a call to `save_screen()`."""
 
-    # print("\x1b[?47l")
-    _tput(["rmcup"])
+    _write("\x1b[?1049l")
 
 
 def set_alt_buffer() -> None:
@@ -326,30 +550,20 @@ def clear(what: str = "screen") -> None:
 
     """
 
-    commands = {
-        "eos": "\x1b[0J",
-        "bos": "\x1b[1J",
-        "screen": "\x1b[2J",
-        "eol": "\x1b[0K",
-        "bol": "\x1b[1K",
-        "line": "\x1b[2K",
-    }
-
-    _stdout.write(commands[what])
+    _write(_CLEAR[what])
+    terminal.clear_count += 1
 
 
 # cursor commands
 def hide_cursor() -> None:
     """Don't print cursor"""
 
-    # _tput(['civis'])
     print("\x1b[?25l")
 
 
 def show_cursor() -> None:
     """Set cursor printing back on"""
 
-    # _tput(['cvvis'])
     print("\x1b[?25h")
 
 
@@ -357,27 +571,27 @@ def save_cursor() -> None:
     """Save cursor position, use `restore_cursor()`
     to restore it."""
 
-    # _tput(['sc'])
-    _stdout.write("\x1b[s")
+    _write("\x1b[s")
 
 
 def restore_cursor() -> None:
     """Restore cursor position saved by `save_cursor()`"""
 
-    # _tput(['rc'])
-    _stdout.write("\x1b[u")
+    _write("\x1b[u")
 
 
 def report_cursor() -> Optional[tuple[int, int]]:
     """Get position of cursor"""
 
-    print("\x1b[6n")
-    chars = getch()
-    posy, posx = chars[2:-1].split(";")
+    # The query has to reach the terminal before we can read its response
+    _write("\x1b[6n")
+    flush()
 
-    if not posx.isdigit() or not posy.isdigit():
+    match = _RE_CURSOR_REPORT.match(getch())
+    if match is None:
         return None
 
+    posy, posx = match.groups()
     return int(posx), int(posy)
 
 
@@ -385,58 +599,60 @@ def move_cursor(pos: tuple[int, int]) -> None:
     """Move cursor to pos"""
 
     posx, posy = pos
-    _stdout.write(f"\x1b[{posy};{posx}H")
+    _write(f"\x1b[{posy};{posx}H")
 
 
 def cursor_up(num: int = 1) -> None:
     """Move cursor up by `num` lines"""
 
-    _stdout.write(f"\x1b[{num}A")
+    _write(_CURSOR_UP.get(num) or f"\x1b[{num}A")
 
 
 def cursor_down(num: int = 1) -> None:
     """Move cursor down by `num` lines"""
 
-    _stdout.write(f"\x1b[{num}B")
+    _write(_CURSOR_DOWN.get(num) or f"\x1b[{num}B")
 
 
 def cursor_right(num: int = 1) -> None:
     """Move cursor left by `num` cols"""
 
-    _stdout.write(f"\x1b[{num}C")
+    _write(_CURSOR_RIGHT.get(num) or f"\x1b[{num}C")
 
 
 def cursor_left(num: int = 1) -> None:
     """Move cursor left by `num` cols"""
 
-    _stdout.write(f"\x1b[{num}D")
+    _write(_CURSOR_LEFT.get(num) or f"\x1b[{num}D")
 
 
 def cursor_next_line(num: int = 1) -> None:
     """Move cursor to beginning of num-th line down"""
 
-    _stdout.write(f"\x1b[{num}E")
+    _write(_CURSOR_NEXT_LINE.get(num) or f"\x1b[{num}E")
 
 
 def cursor_prev_line(num: int = 1) -> None:
     """Move cursor to beginning of num-th line down"""
 
-    _stdout.write(f"\x1b[{num}F")
+    _write(_CURSOR_PREV_LINE.get(num) or f"\x1b[{num}F")
 
 
 def cursor_column(num: int = 0) -> None:
     """Move cursor to num-th column in the current line"""
 
-    _stdout.write(f"\x1b[{num}G")
+    _write(_CURSOR_COLUMN.get(num) or f"\x1b[{num}G")
 
 
 def cursor_home() -> None:
     """Move cursor to HOME"""
 
-    _stdout.write("\x1b[H")
+    _write("\x1b[H")
 
 
-def set_mode(mode: Union[str, int], write: bool = True) -> str:
+def set_mode(
+    mode: Union[str, int], write: bool = True  # pylint: disable=redefined-outer-name
+) -> str:
     """Set terminal display mode
 
     Available options:
@@ -452,24 +668,9 @@ def set_mode(mode: Union[str, int], write: bool = True) -> str:
 
     You can use both the digit and text forms."""
 
-    options = {
-        "reset": 0,
-        "bold": 1,
-        "dim": 2,
-        "italic": 3,
-        "underline": 4,
-        "blink": 5,
-        "inverse": 7,
-        "invisible": 8,
-        "strikethrough": 9,
-    }
-
-    if not str(mode).isdigit():
-        mode = options[str(mode)]
-
-    code = f"\x1b[{mode}m"
+    code = _mode_code(mode)
     if write:
-        _stdout.write(code)
+        _write(code)
 
     return code
 
@@ -535,6 +736,35 @@ class MouseEvent:
         return self
 
 
+_MOUSE_EVENTS = {"press": 1000, "highlight": 1001, "press_hold": 1002, "hover": 1003}
+_MOUSE_METHODS = {
+    None: None,
+    "decimal_utf8": 1005,
+    "decimal_xterm": 1006,
+    "decimal_urxvt": 1015,
+}
+
+
+def _get_mouse_sequences() -> dict[tuple[str, Optional[str], bool], str]:
+    """Build the sequence for every (event, method, stop) combination"""
+
+    sequences = {}
+    for event, event_code in _MOUSE_EVENTS.items():
+        for method, method_code in _MOUSE_METHODS.items():
+            for stop in [False, True]:
+                suffix = "l" if stop else "h"
+                sequence = f"\x1b[?{event_code}{suffix}"
+                if method_code is not None:
+                    sequence += f"\x1b[?{method_code}{suffix}"
+
+                sequences[(event, method, stop)] = sequence
+
+    return sequences
+
+
+_MOUSE_SEQUENCES = _get_mouse_sequences()
+
+
 def report_mouse(
     event: str, method: Optional[str] = "decimal_xterm", stop: bool = False
 ) -> None:
@@ -555,39 +785,14 @@ def report_mouse(
     more information: https://stackoverflow.com/a/5970472
     """
 
-    if event == "press":
-        _stdout.write("\x1b[?1000")
-
-    elif event == "highlight":
-        _stdout.write("\x1b[?1001")
-
-    elif event == "press_hold":
-        _stdout.write("\x1b[?1002")
-
-    elif event == "hover":
-        _stdout.write("\x1b[?1003")
-
-    else:
-        raise NotImplementedError(f"Mouse report event {event} is not supported!")
-
-    _stdout.write("l" if stop else "h")
-
-    if method == "decimal_utf8":
-        _stdout.write("\x1b[?1005")
-
-    elif method == "decimal_xterm":
-        _stdout.write("\x1b[?1006")
-
-    elif method == "decimal_urxvt":
-        _stdout.write("\x1b[?1015")
-
-    elif method is None:
-        return
+    sequence = _MOUSE_SEQUENCES.get((event, method, stop))
+    if sequence is None:
+        if event not in _MOUSE_EVENTS:
+            raise NotImplementedError(f"Mouse report event {event} is not supported!")
 
-    else:
         raise NotImplementedError(f"Mouse report method {method} is not supported!")
 
-    _stdout.write("l" if stop else "h")
+    _write(sequence)
     _stdout.flush()
 
 
@@ -657,63 +862,63 @@ def translate_mouse(code: str, method: str) -> list[MouseEvent | None] | None:
 def print_to(pos: tuple[int, int], *args: tuple[Any, ...]) -> None:
     """Print text to given position"""
 
-    text = ""
-    for arg in args:
-        text += " " + str(arg)
+    # Every argument is preceded by a space
+    text = "".join(" " + str(arg) for arg in args)
 
-    move_cursor(pos)
-    print(text, end="", flush=True)
+    with batched():
+        move_cursor(pos)
+        _write(text)
 
 
 def reset() -> str:
     """Reset printing mode"""
 
-    return set_mode("reset", False)
+    return _RESET
 
 
 def bold(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text in bold"""
 
-    return set_mode("bold", False) + text + (reset() if reset_style else "")
+    return _BOLD + text + (_RESET if reset_style else "")
 
 
 def dim(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text in dim"""
 
-    return set_mode("dim", False) + text + (reset() if reset_style else "")
+    return _DIM + text + (_RESET if reset_style else "")
 
 
 def italic(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text in italic"""
 
-    return set_mode("italic", False) + text + (reset() if reset_style else "")
+    return _ITALIC + text + (_RESET if reset_style else "")
 
 
 def underline(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text underlined"""
 
-    return set_mode("underline", False) + text + (reset() if reset_style else "")
+    return _UNDERLINE + text + (_RESET if reset_style else "")
 
 
 def blinking(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text blinking"""
 
-    return set_mode("blink", False) + text + (reset() if reset_style else "")
+    return _BLINK + text + (_RESET if reset_style else "")
 
 
 def inverse(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text inverse-colored"""
 
-    return set_mode("inverse", False) + text + (reset() if reset_style else "")
+    return _INVERSE + text + (_RESET if reset_style else "")
 
 
 def invisible(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text in invisible"""
 
-    return set_mode("invisible", False) + text + (reset() if reset_style else "")
+    return _INVISIBLE + text + (_RESET if reset_style else "")
 
 
 def strikethrough(text: str, reset_style: Optional[bool] = True) -> str:
     """Return text as strikethrough"""
 
-    return set_mode("strikethrough", False) + text + (reset() if reset_style else "")
+    return _STRIKETHROUGH + text + (_RESET if reset_style else "")
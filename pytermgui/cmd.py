@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import sys
 from random import randint
+from functools import partial
 from itertools import zip_longest
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Type
@@ -112,19 +113,18 @@ class LauncherApplication(Application):
     def finish(self, _: Window) -> None:
         """Do nothing on finish"""
 
+    def _launch(self, app: Application, *_: Any) -> None:
+        """Add a window of app to the manager"""
+
+        self.manager.add(app.construct_window())
+
     def construct_window(self) -> Window:
         """Construct an application window"""
 
         window = self._get_base_window(width=30, is_noblur=False) + ""
-        manager = self.manager
 
         for app in self.apps:
-            button = Button(app.title)
-            button.onclick = lambda *_, button=button: manager.add(
-                button.app.construct_window()
-            )
-            button.app = app
-            window += button
+            window += Button(app.title, onclick=partial(self._launch, app))
 
         window += ""
         window += Label("[247 italic]> Choose an app to run", parent_align=0)
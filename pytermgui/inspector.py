@@ -17,6 +17,7 @@ Todo: handle long items
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Any
 from inspect import signature, getdoc, isclass, ismodule, Signature
 
@@ -44,6 +45,42 @@ def create_color_style(color: int) -> StyleType:
     return color_style
 
 
+@lru_cache(maxsize=128)
+def _get_functions(
+    target: type, show_dunder: bool, show_private: bool
+) -> tuple[Any, ...]:
+    """Get all inspectable functions of a class
+
+    Walking `dir()` is slow for larger classes, so the result is cached per class."""
+
+    functions = []
+    for name in dir(target):
+        value = getattr(target, name)
+
+        value_name = getattr(value, "__name__", None)
+
+        if value_name:
+            if (
+                not show_dunder
+                and value_name.startswith("__")
+                and value_name.endswith("__")
+                and not value_name == "__init__"
+            ):
+                continue
+
+            if (
+                not show_private
+                and value_name.startswith("_")
+                and not value_name.endswith("__")
+            ):
+                continue
+
+        if callable(value) and not isinstance(value, type):
+            functions.append(value)
+
+    return tuple(functions)
+
+
 def inspect(
     target: Any,
     style: bool = True,
@@ -123,7 +160,7 @@ def inspect(
                     scroll = previous
 
             root.center()
-            root.print()
+            root.print_changes()
 
     print("Inspection complete!")
     if is_interactive():
@@ -281,35 +318,12 @@ class Inspector(Container):
             self._add_widget(Label())
 
             if hasattr(target, "_inspectable"):
-                functions = [
+                functions = tuple(
                     getattr(target, name) for name in getattr(target, "_inspectable")
-                ]
+                )
 
             else:
-                functions = []
-                for name in dir(target):
-                    value = getattr(target, name)
-
-                    value_name = getattr(value, "__name__", None)
-
-                    if value_name:
-                        if (
-                            not show_dunder
-                            and value_name.startswith("__")
-                            and value_name.endswith("__")
-                            and not value_name == "__init__"
-                        ):
-                            continue
-
-                        if (
-                            not show_private
-                            and value_name.startswith("_")
-                            and not value_name.endswith("__")
-                        ):
-                            continue
-
-                    if callable(value) and not isinstance(value, type):
-                        functions.append(value)
+                functions = _get_functions(target, show_dunder, show_private)
 
             for function in functions:
                 self.inspect(function, keep_elements=True, _padding=_padding + 4)
@@ -11,7 +11,7 @@ saving & loading widgets.
 from __future__ import annotations
 
 import json
-from typing import Any, Type, IO, Dict
+from typing import Any, Type, IO, Dict, Callable
 
 from . import widgets
 from .parser import markup
@@ -21,6 +21,7 @@ from .widgets import styles, CharType
 from .window_manager import Window
 
 WidgetDict = Dict[str, Type[Widget]]
+KeyLoader = Callable[[Widget, Any], None]
 
 __all__ = ["serializer", "Serializer"]
 
@@ -45,6 +46,12 @@ class Serializer:
         self.known_widgets = self.get_widgets()
         self.register(Window)
 
+        # Keys whose values need converting when loaded, all others are set as-is
+        self._key_loaders: dict[str, KeyLoader] = {
+            "chars": self._load_chars,
+            "styles": self._load_styles,
+        }
+
     @staticmethod
     def get_widgets() -> WidgetDict:
         """Get all widgets from the module"""
@@ -73,21 +80,43 @@ class Serializer:
 
         self.known_widgets[cls.__name__] = cls
 
-    def from_dict(
-        self, data: dict[str, Any], widget_type: str | None = None
-    ) -> Widget:  # pylint: disable=too-many-locals
-        """Load a widget from a dictionary"""
+    @staticmethod
+    def _apply_markup(value: CharType) -> CharType:
+        """Apply markup style to obj's key"""
+
+        formatted: CharType
+        if isinstance(value, list):
+            formatted = [markup.parse(val) for val in value]
+        else:
+            formatted = markup.parse(value)
+
+        return formatted
+
+    def _load_chars(self, obj: Widget, value: dict[str, CharType]) -> None:
+        """Load chars of obj, parsing their markup"""
+
+        chars: dict[str, CharType] = {}
+        for name, char in value.items():
+            chars[name] = self._apply_markup(char)
+
+        setattr(obj, "chars", chars)
+
+    @staticmethod
+    def _load_styles(obj: Widget, value: dict[str, Any]) -> None:
+        """Load styles of obj, converting markup strings into MarkupFormatters"""
 
-        def _apply_markup(value: CharType) -> CharType:
-            """Apply markup style to obj's key"""
+        obj_styles = obj.styles.copy()
+        for name, markup_str in value.items():
+            if isinstance(markup_str, str):
+                obj_styles[name] = styles.MarkupFormatter(markup_str)
+                continue
 
-            formatted: CharType
-            if isinstance(value, list):
-                formatted = [markup.parse(val) for val in value]
-            else:
-                formatted = markup.parse(value)
+            obj_styles[name] = markup_str
 
-            return formatted
+        setattr(obj, "styles", obj_styles)
+
+    def from_dict(self, data: dict[str, Any], widget_type: str | None = None) -> Widget:
+        """Load a widget from a dictionary"""
 
         if widget_type is not None:
             data["type"] = widget_type
@@ -122,27 +151,12 @@ class Serializer:
 
                 continue
 
-            if key == "chars":
-                chars: dict[str, CharType] = {}
-                for name, char in value.items():
-                    chars[name] = _apply_markup(char)
-
-                setattr(obj, "chars", chars)
-                continue
-
-            if key == "styles":
-                obj_styles = obj.styles.copy()
-                for name, markup_str in value.items():
-                    if isinstance(markup_str, str):
-                        obj_styles[name] = styles.MarkupFormatter(markup_str)
-                        continue
-
-                    obj_styles[name] = markup_str
-
-                setattr(obj, "styles", obj_styles)
+            loader = self._key_loaders.get(key)
+            if loader is None:
+                setattr(obj, key, value)
                 continue
 
-            setattr(obj, key, value)
+            loader(obj, value)
 
         return obj
 
@@ -13,18 +13,26 @@ This submodule the basic elements this library provides.
 
 from __future__ import annotations
 
-from copy import deepcopy
+from types import MethodType
 from inspect import signature
-from dataclasses import dataclass, field
-from typing import Callable, Optional, Type, Iterator, Any
+from functools import lru_cache
+from typing import Callable, Optional, Type, Iterable, Iterator, Any
 
 from ..input import keys
 from ..parser import markup
-from ..context_managers import cursor_at
 from ..helpers import real_length, break_line
 from ..exceptions import WidthExceededError, LineLengthError
 from ..enums import SizePolicy, CenteringPolicy, WidgetAlignment
-from ..ansi_interface import terminal, clear, MouseEvent, MouseAction
+from ..ansi_interface import (
+    terminal,
+    clear,
+    batched,
+    write,
+    save_cursor,
+    restore_cursor,
+    MouseEvent,
+    MouseAction,
+)
 
 from . import boxes
 from . import styles as w_styles
@@ -35,6 +43,20 @@ __all__ = ["MouseTarget", "MouseCallback", "Widget", "Container", "Label"]
 MouseCallback = Callable[["MouseTarget", "Widget"], Any]
 BoundCallback = Callable[..., Any]
 
+# Border segments, fill and most widget lines are the same from frame to frame,
+# so their lengths are cached for the rendering hot path.
+_cached_real_length = lru_cache(maxsize=1024)(real_length)
+
+
+def _real_length(text: str) -> int:
+    """Get real length of text, skipping escape sequence stripping for plain strings"""
+
+    # All ANSI sequences start with ESC, so text without one is measured as-is
+    if "\x1b" not in text:
+        return len(text)
+
+    return _cached_real_length(text)
+
 
 def _set_obj_or_cls_style(
     obj_or_cls: Type[Widget] | Widget, key: str, value: w_styles.StyleType
@@ -65,20 +87,111 @@ def _set_obj_or_cls_char(
     return obj_or_cls
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _parse_serialized(fields: tuple[str, ...]) -> tuple[tuple[str, bool], ...]:
+    """Split serialized field names into (name, is_styled) pairs"""
+
+    return tuple(
+        (key[1:], True) if key.startswith("*") else (key, False) for key in fields
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_data_descriptors(cls: type) -> frozenset[str]:
+    """Get names of the data descriptors (e.g. properties) of a class"""
+
+    return frozenset(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if hasattr(type(value), "__set__")
+    )
+
+
+def _get_padding(
+    alignment: WidgetAlignment, available: int, length: int
+) -> tuple[int, int]:
+    """Get the left & right padding that fits length into available
+
+    These can be negative when length doesn't fit, which pads with nothing."""
+
+    total = available - length
+
+    if alignment == WidgetAlignment.CENTER:
+        padding, offset = divmod(total, 2)
+        return padding + offset, padding
+
+    if alignment == WidgetAlignment.RIGHT:
+        return total, 0
+
+    # Default to left-aligned
+    return 0, total
+
+
+class _ObjOrClsMethod:  # pylint: disable=too-few-public-methods
+    """A method that binds to the instance it is accessed through, or to the class
+    when accessed through that."""
+
+    def __init__(self, method: Callable[..., Any]) -> None:
+        """Store method"""
+
+        self.method = method
+
+    def __get__(
+        self, obj: object, objtype: Optional[type] = None
+    ) -> Callable[..., Any]:
+        """Bind method to obj, or objtype if there is no obj"""
+
+        return MethodType(self.method, objtype if obj is None else obj)
+
+
 class MouseTarget:
     """A target for mouse events."""
 
-    parent: Widget
-    left: int
-    right: int
-    height: int
-    top: int = 0
+    # Targets are recreated on every redraw, so they skip having a __dict__
+    __slots__ = (
+        "parent",
+        "left",
+        "right",
+        "height",
+        "top",
+        "onclick",
+        "_start",
+        "_end",
+        "_bounds",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        parent: Widget,
+        left: int,
+        right: int,
+        height: int,
+        top: int = 0,
+        onclick: Optional[MouseCallback] = None,
+    ) -> None:
+        """Initialize object"""
+
+        self.parent = parent
+        self.left = left
+        self.right = right
+        self.height = height
+        self.top = top
+        self.onclick = onclick
 
-    _start: tuple[int, int] = field(init=False)
-    _end: tuple[int, int] = field(init=False)
+        self._start: tuple[int, int]
+        self._end: tuple[int, int]
 
-    onclick: Optional[MouseCallback] = None
+        # (start_x, start_y, end_x, end_y), flattened for quick hit testing
+        self._bounds: tuple[int, int, int, int]
+
+    def __repr__(self) -> str:
+        """Return identifiable information about object"""
+
+        return (
+            f"MouseTarget(parent={type(self.parent).__name__}, left={self.left},"
+            + f" right={self.right}, height={self.height}, top={self.top})"
+        )
 
     @property
     def start(self) -> tuple[int, int]:
@@ -101,14 +214,15 @@ class MouseTarget:
             pos[0] + self.parent.width - 1 - self.right,
             pos[1] + self.top + self.height,
         )
+        self._bounds = self._start + self._end  # type: ignore
 
     def contains(self, pos: tuple[int, int]) -> bool:
         """Check if button area contains pos"""
 
-        start = self._start
-        end = self._end
+        start_x, start_y, end_x, end_y = self._bounds
+        pos_x, pos_y = pos
 
-        return start[0] <= pos[0] <= end[0] and start[1] <= pos[1] <= end[1]
+        return start_x <= pos_x <= end_x and start_y <= pos_y <= end_y
 
     def click(self, caller: Widget) -> None:
         """Execute callback with caller as the argument"""
@@ -124,17 +238,25 @@ class MouseTarget:
         if color is None:
             color = 210
 
-        for y_pos in range(self._start[1], self._end[1] + 1):
-            with cursor_at((self._start[0], y_pos)) as print_here:
-                length = self._end[0] - self._start[0]
-                print_here(markup.parse(f"[@{color}]" + " " * length))
+        start_x, start_y, end_x, end_y = self._bounds
+        fill = markup.parse(f"[@{color}]" + " " * (end_x - start_x))
+
+        with batched():
+            save_cursor()
+            write(
+                "".join(
+                    f"\x1b[{y_pos};{start_x}H {fill}"
+                    for y_pos in range(start_y, end_y + 1)
+                )
+            )
+            restore_cursor()
 
 
 class Widget:
     """The widget from which all UI classes derive from"""
 
-    set_style = classmethod(_set_obj_or_cls_style)
-    set_char = classmethod(_set_obj_or_cls_char)
+    set_style = _ObjOrClsMethod(_set_obj_or_cls_style)
+    set_char = _ObjOrClsMethod(_set_obj_or_cls_char)
 
     styles: dict[str, w_styles.StyleType] = {}
     chars: dict[str, w_styles.CharType] = {}
@@ -161,9 +283,6 @@ class Widget:
     def __init__(self, **attrs: Any) -> None:
         """Initialize universal data for objects"""
 
-        self.set_style = lambda key, value: _set_obj_or_cls_style(self, key, value)
-        self.set_char = lambda key, value: _set_obj_or_cls_char(self, key, value)
-
         self.width = 1
         self.height = 1
         self.pos = terminal.origin
@@ -175,6 +294,11 @@ class Widget:
 
         self.mouse_targets: list[MouseTarget] = []
 
+        # The last get_target result, as (pos, mouse_targets it was found in, target)
+        self._last_hit: tuple[
+            tuple[int, int], list[MouseTarget], Optional[MouseTarget]
+        ] | None = None
+
         self.parent: Widget | None = None
         self.selected_index: int | None = None
         self.onclick: MouseCallback | None = None
@@ -184,8 +308,16 @@ class Widget:
         self._serialized_fields = type(self).serialized
         self._bindings: dict[str | Type[MouseEvent], tuple[BoundCallback, str]] = {}
 
+        # Plain attributes are stored directly, only descriptors need setattr
+        descriptors = _get_data_descriptors(type(self))
+        instance_dict = vars(self)
+
         for attr, value in attrs.items():
-            setattr(self, attr, value)
+            if attr in descriptors:
+                setattr(self, attr, value)
+                continue
+
+            instance_dict[attr] = value
 
     def __repr__(self) -> str:
         """Print self.debug() by default"""
@@ -251,6 +383,14 @@ class Widget:
 
         return self.selectables_length != 0
 
+    def _invalidate_selectables(self) -> None:
+        """Drop the selectables cached by the Containers this widget is in
+
+        Call this whenever the value of `selectables` might have changed."""
+
+        if self.parent is not None:
+            self.parent._invalidate_selectables()  # pylint: disable=protected-access
+
     def static_width(self, value: int) -> None:
         """Write-only setter for width that also changes
         `size_policy` to `STATIC`"""
@@ -270,17 +410,35 @@ class Widget:
 
         target.adjust()
         self.mouse_targets.insert(0, target)
+        self._last_hit = None
 
         return target
 
     def get_target(self, pos: tuple[int, int]) -> Optional[MouseTarget]:
         """Get MouseTarget for a position"""
 
+        # Consecutive mouse events often land on the same position
+        last_hit = self._last_hit
+        if (
+            last_hit is not None
+            and last_hit[0] == pos
+            and last_hit[1] is self.mouse_targets
+        ):
+            return last_hit[2]
+
+        found: Optional[MouseTarget] = None
+
+        # This is `target.contains(pos)`, inlined as it runs for every mouse event
+        # pylint: disable=protected-access
+        pos_x, pos_y = pos
         for target in self.mouse_targets:
-            if target.contains(pos):
-                return target
+            start_x, start_y, end_x, end_y = target._bounds
+            if start_x <= pos_x <= end_x and start_y <= pos_y <= end_y:
+                found = target
+                break
 
-        return None
+        self._last_hit = (pos, self.mouse_targets, found)
+        return found
 
     def handle_mouse(
         self, event: MouseEvent, target: MouseTarget | None = None
@@ -307,17 +465,11 @@ class Widget:
     def serialize(self) -> dict[str, Any]:
         """Serialize object based on type(object).serialized"""
 
-        fields = self._serialized_fields
+        # Styled values are marked with a "*" prefix
+        fields = _parse_serialized(tuple(self._serialized_fields))
 
         out: dict[str, Any] = {"type": type(self).__name__}
-        for key in fields:
-            # Detect styled values
-            if key.startswith("*"):
-                style = True
-                key = key[1:]
-            else:
-                style = False
-
+        for key, style in fields:
             value = getattr(self, key)
 
             # Convert styled value into markup
@@ -347,10 +499,28 @@ class Widget:
         return out
 
     def copy(self) -> Widget:
-        """Copy widget into a new object"""
+        """Copy widget into a new, parentless object
+
+        Mutable attributes are copied one level deep, and mouse targets
+        are recreated by the copy's next `get_lines` call."""
 
         # TODO: Properly handle ids
-        return deepcopy(self)
+        new = type(self).__new__(type(self))
+        vars(new).update(
+            (key, value.copy() if isinstance(value, (list, dict, set)) else value)
+            for key, value in vars(self).items()
+        )
+
+        new.chars = {
+            key: (value.copy() if isinstance(value, list) else value)
+            for key, value in self.chars.items()
+        }
+
+        new.parent = None
+        new.mouse_targets = []
+        new._last_hit = None
+
+        return new
 
     def get_style(self, key: str) -> w_styles.DepthlessStyleType:
         """Try to get style"""
@@ -360,7 +530,9 @@ class Widget:
         return w_styles.StyleCall(self, style_method)
 
     def get_char(self, key: str) -> w_styles.CharType:
-        """Try to get char"""
+        """Try to get char
+
+        List chars are copied, so the result can be changed freely."""
 
         chars = self.chars[key]
         if isinstance(chars, str):
@@ -430,34 +602,21 @@ class Widget:
     def debug(self) -> str:
         """Debug identifiable information about object"""
 
-        constructor = "("
+        args = []
         for name in signature(getattr(self, "__init__")).parameters:
-            current = ""
             if name == "attrs":
-                current += "**attrs"
                 continue
 
-            if len(constructor) > 1:
-                current += ", "
-
-            current += name
-
             attr = getattr(self, name, None)
             if attr is None:
                 continue
 
-            current += "="
-
             if isinstance(attr, str):
-                current += f'"{attr}"'
+                args.append(f'{name}="{attr}"')
             else:
-                current += str(attr)
+                args.append(f"{name}={attr}")
 
-            constructor += current
-
-        constructor += ")"
-
-        return type(self).__name__ + constructor
+        return type(self).__name__ + "(" + ", ".join(args) + ")"
 
 
 class Container(Widget):
@@ -493,35 +652,54 @@ class Container(Widget):
             self.width = 40
 
         self._widgets: list[Widget] = []
+        self._selectables_cache: list[tuple[Widget, int]] | None = None
+
+        # The inner widget our last `select` call selected
+        self._selected_widget: Widget | None = None
         self._centered_axis: CenteringPolicy | None = None
 
         self._prev_screen: tuple[int, int] = (0, 0)
         self._has_printed = False
 
+        # Lines on screen since the last print, and the (pos, clear_count) they were
+        # printed with. Only changed lines are reprinted while the latter matches.
+        self._printed_lines: list[str] = []
+        self._printed_state: tuple[tuple[int, int], int] | None = None
+
         self.styles = type(self).styles.copy()
         self.chars = type(self).chars.copy()
 
-        for widget in widgets:
-            self._add_widget(widget)
+        # Styled border & corner chars, and the key they were made for
+        self._borders: tuple[str, ...] = ()
+        self._borders_key: tuple[Any, ...] | None = None
+
+        # Top & bottom border lines, and the (width, borders) they were made for
+        self._caps: tuple[str, str] = ("", "")
+        self._caps_key: tuple[int, tuple[str, ...]] | None = None
+
+        self._add_widgets(widgets)
 
         self._drag_target: Widget | None = None
-        terminal.subscribe(terminal.RESIZE, lambda *_: self.center(self._centered_axis))
+        terminal.subscribe(terminal.RESIZE, self._recenter)
 
     @property
     def sidelength(self) -> int:
         """Returns length of left+right borders"""
 
-        chars = self.get_char("border")
-        style = self.get_style("border")
-        if not isinstance(chars, list):
+        if not isinstance(self.chars["border"], list):
             return 0
 
-        left_border, _, right_border, _ = chars
-        return real_length(style(left_border) + style(right_border))
+        left_border, _, right_border, _ = self._get_borders()[:4]
+        return _real_length(left_border + right_border)
 
     @property
     def selectables(self) -> list[tuple[Widget, int]]:
-        """Get all selectable widgets and their inner indexes"""
+        """Get all selectable widgets and their inner indexes
+
+        The result is cached until `_invalidate_selectables` is called."""
+
+        if self._selectables_cache is not None:
+            return self._selectables_cache
 
         _selectables: list[tuple[Widget, int]] = []
         for widget in self._widgets:
@@ -531,6 +709,7 @@ class Container(Widget):
             for i, (inner, _) in enumerate(widget.selectables):
                 _selectables.append((inner, i))
 
+        self._selectables_cache = _selectables
         return _selectables
 
     @property
@@ -606,6 +785,8 @@ class Container(Widget):
         """Set item in self._widgets"""
 
         self._widgets[index] = value
+        self._invalidate_selectables()
+        self._forget_removed_selection()
 
     def __contains__(self, other: object) -> bool:
         """Find if Container contains other"""
@@ -635,49 +816,105 @@ class Container(Widget):
 
         other.get_lines()
         other.parent = self
+        self._invalidate_selectables()
 
         self.height += other.height
 
         if run_get_lines:
             self.get_lines()
 
-    def _get_aligners(
-        self, widget: Widget, borders: tuple[str, str]
-    ) -> tuple[Callable[[str], str], int]:
-        """Get aligner method & offset for alignment value"""
+    def _add_widgets(self, widgets: Iterable[object]) -> None:
+        """Add all widgets, only updating our own lines once at the end"""
 
-        left, right = borders
-        char = self.get_style("fill")(" ")
+        added = False
+        for widget in widgets:
+            self._add_widget(widget, run_get_lines=False)
+            added = True
+
+        if added:
+            self.get_lines()
+
+    def _invalidate_selectables(self) -> None:
+        """Drop our cached selectables, along with those of our parents"""
+
+        self._selectables_cache = None
+        super()._invalidate_selectables()
+
+    def _get_borders(self) -> tuple[str, ...]:
+        """Get styled border chars followed by styled corner chars
+
+        These are only restyled when their depth, styles or chars change."""
 
-        def _align_left(text: str) -> str:
-            """Align line left"""
+        border_char = self.chars["border"]
+        assert isinstance(border_char, list)
+        corner_char = self.chars["corner"]
+        assert isinstance(corner_char, list)
+
+        border_style = self.styles["border"]
+        corner_style = self.styles["corner"]
+
+        key = (self.depth, border_style, corner_style, *border_char, *corner_char)
+        if key != self._borders_key:
+            border_call = self.get_style("border")
+            corner_call = self.get_style("corner")
+
+            self._borders = tuple(
+                [border_call(char) for char in border_char]
+                + [corner_call(char) for char in corner_char]
+            )
+            self._borders_key = key
+
+        return self._borders
+
+    def _get_caps(self) -> tuple[str, str]:
+        """Get top & bottom border lines, empty if that border has no visible char
 
-            padding = self.width - real_length(left + right) - real_length(text)
-            return left + text + padding * char + right
+        These are reused for as long as our width & borders stay the same."""
 
-        def _align_center(text: str) -> str:
-            """Align line center"""
+        borders = self._get_borders()
+        key = (self.width, borders)
+        if key == self._caps_key:
+            return self._caps
 
-            total = self.width - real_length(left + right) - real_length(text)
-            padding, offset = divmod(total, 2)
-            return left + (padding + offset) * char + text + padding * char + right
+        _, top, _, bottom, t_left, t_right, b_right, b_left = borders
+
+        def _get_border(left: str, char: str, right: str) -> str:
+            """Get a border line"""
+
+            if not _real_length(char):
+                return ""
+
+            offset = _real_length(left + right)
+            return left + char * (self.width - offset) + right
+
+        self._caps = (
+            _get_border(t_left, top, t_right),
+            _get_border(b_left, bottom, b_right),
+        )
+        self._caps_key = key
+
+        return self._caps
+
+    def _get_aligners(
+        self, widget: Widget, borders: tuple[str, str], char: str
+    ) -> tuple[Callable[[str], str], int]:
+        """Get aligner method & offset for alignment value, padding with char"""
 
-        def _align_right(text: str) -> str:
-            """Align line right"""
+        left, right = borders
+        left_len = _real_length(left)
+        available = self.width - left_len - _real_length(right)
+        alignment = widget.parent_align
 
-            padding = self.width - real_length(left + right) - real_length(text)
-            return left + padding * char + text + right
+        def _align(text: str) -> str:
+            """Align line according to alignment"""
 
-        if widget.parent_align == WidgetAlignment.CENTER:
-            total = self.width - real_length(left + right) - widget.width
-            padding, offset = divmod(total, 2)
-            return _align_center, real_length(left) + padding + offset
+            left_pad, right_pad = _get_padding(alignment, available, _real_length(text))
+            return left + left_pad * char + text + right_pad * char + right
 
-        if widget.parent_align == WidgetAlignment.RIGHT:
-            return _align_right, self.width - real_length(left) - widget.width
+        if alignment == WidgetAlignment.RIGHT:
+            return _align, self.width - left_len - widget.width
 
-        # Default to left-aligned
-        return _align_left, real_length(left)
+        return _align, left_len + _get_padding(alignment, available, widget.width)[0]
 
     def _update_width(self, widget: Widget) -> None:
         """Update width of widget & self"""
@@ -709,33 +946,10 @@ class Container(Widget):
 
         Note about pylint: Having less locals in this method would ruin readability."""
 
-        def _apply_style(
-            style: w_styles.DepthlessStyleType, target: list[str]
-        ) -> list[str]:
-            """Apply style to target list elements"""
-
-            for i, char in enumerate(target):
-                target[i] = style(char)
-
-            return target
-
-        # Get chars & styles
-        corner_style = self.get_style("corner")
-        border_style = self.get_style("border")
-
-        border_char = self.get_char("border")
-        assert isinstance(border_char, list)
-        corner_char = self.get_char("corner")
-        assert isinstance(corner_char, list)
-
-        left, top, right, bottom = _apply_style(border_style, border_char)
-        t_left, t_right, b_right, b_left = _apply_style(corner_style, corner_char)
-
-        def _get_border(left: str, char: str, right: str) -> str:
-            """Get a border line"""
-
-            offset = real_length(left + right)
-            return left + char * (self.width - offset) + right
+        left, top, right, bottom, t_left, t_right, b_right, b_left = self._get_borders()
+        fill = self.get_style("fill")(" ")
+        fill_len = _real_length(fill)
+        border_len = _real_length(left) + _real_length(right)
 
         # Set up lines list
         lines: list[str] = []
@@ -751,14 +965,15 @@ class Container(Widget):
             self.pos = terminal.origin
             self.width, self.height = terminal.size
 
-        align, offset = self._get_aligners(self, (left, right))
+        align, offset = self._get_aligners(self, (left, right), fill)
 
         # Go through widgets
         for widget in self._widgets:
             if self.width == 0:
                 self.width = widget.width
 
-            align, offset = self._get_aligners(widget, (left, right))
+            align, offset = self._get_aligners(widget, (left, right), fill)
+            available = self.width - border_len
 
             # Apply width policies
             self._update_width(widget)
@@ -766,10 +981,7 @@ class Container(Widget):
             # TODO: This is ugly, and should be avoided.
             # For now, only Container has a top offset, but this should be
             # opened up as some kind of API for custom widgets.
-            if type(widget).__name__ == "Container":
-                container_vertical_offset = 1
-            else:
-                container_vertical_offset = 0
+            container_vertical_offset = 1 if type(widget) is Container else 0
 
             widget.pos = (
                 self.pos[0] + offset,
@@ -781,9 +993,14 @@ class Container(Widget):
             for i, line in enumerate(widget.get_lines()):
                 # Pad horizontally
                 aligned = align(line)
-                new = real_length(aligned)
 
-                # Assert well formed lines
+                # Assert well formed lines. Padding brings every line that fits
+                # to exactly our width, so only lines too long need measuring.
+                if _real_length(line) > available or not fill_len == 1:
+                    new = _real_length(aligned)
+                else:
+                    new = self.width
+
                 if not new == self.width:
                     raise LineLengthError(
                         f"Widget {widget} returned a line of invalid length"
@@ -804,24 +1021,60 @@ class Container(Widget):
         self.height = len(lines) - 2
 
         # Add capping lines
-        if real_length(top):
-            lines.insert(0, _get_border(t_left, top, t_right))
+        top_cap, bottom_cap = self._get_caps()
+        if top_cap:
+            lines.insert(0, top_cap)
 
-        if real_length(bottom):
-            lines.append(_get_border(b_left, bottom, b_right))
+        if bottom_cap:
+            lines.append(bottom_cap)
 
+        # This is `target.adjust()`, inlined as it runs for every target on every
+        # frame. Targets belong to our children, so their own parents are used.
+        # pylint: disable=protected-access
         for target in self.mouse_targets:
-            target.adjust()
+            parent = target.parent
+            posx, posy = parent.pos
+            posy += target.top
+
+            start = (posx + target.left - 1, posy + 1)
+            end = (posx + parent.width - 1 - target.right, posy + target.height)
+
+            target._start = start
+            target._end = end
+            target._bounds = start + end  # type: ignore
+
+        self._last_hit = None
 
         # Return
         return lines
 
+    def copy(self) -> Container:
+        """Copy Container, along with copies of all its widgets"""
+
+        new = super().copy()
+        assert isinstance(new, Container)
+
+        new._widgets = []
+        for widget in self._widgets:
+            inner = widget.copy()
+            inner.parent = new
+            new._widgets.append(inner)
+
+        new._selectables_cache = None
+        new._selected_widget = new.selected
+        new._drag_target = None
+        new._printed_lines = []
+        new._printed_state = None
+
+        return new
+
     def set_widgets(self, new: list[Widget]) -> None:
         """Set self._widgets to a new list"""
 
         self._widgets = []
-        for widget in new:
-            self._add_widget(widget)
+        self._invalidate_selectables()
+        self._add_widgets(new)
+        self._forget_removed_selection()
 
     def serialize(self) -> dict[str, Any]:
         """Serialize object"""
@@ -837,12 +1090,38 @@ class Container(Widget):
     def pop(self, index: int) -> Widget:
         """Pop widget from self._widgets"""
 
-        return self._widgets.pop(index)
+        widget = self._widgets.pop(index)
+        self._invalidate_selectables()
+        self._forget_removed_selection()
+
+        return widget
 
     def remove(self, other: Widget) -> None:
         """Remove widget from self._widgets"""
 
-        return self._widgets.remove(other)
+        self._widgets.remove(other)
+        self._invalidate_selectables()
+        self._forget_removed_selection()
+
+    def _forget_removed_selection(self) -> None:
+        """Stop tracking the last selected widget if it left our tree
+
+        Otherwise, a later `select` would unselect it wherever it ended up.
+        Parents are checked too, as they might be tracking the same widget."""
+
+        widget = self._selected_widget
+        while widget is not None and widget is not self:
+            parent = widget.parent
+            if not isinstance(parent, Container) or not any(
+                child is widget for child in parent._widgets
+            ):
+                self._selected_widget = None
+                break
+
+            widget = parent
+
+        if isinstance(self.parent, Container):
+            self.parent._forget_removed_selection()  # pylint: disable=protected-access
 
     def set_recursive_depth(self, value: int) -> None:
         """Set depth for all children, recursively"""
@@ -857,10 +1136,14 @@ class Container(Widget):
     def select(self, index: int | None = None) -> None:
         """Select inner object"""
 
-        # Unselect all sub-elements
-        for other in self._widgets:
-            if other.selectables_length > 0:
-                other.select(None)
+        # Inner widgets are selected through this method, or by their own
+        # `handle_mouse`, which is undone there. Only the one we selected last
+        # needs unselecting.
+        previous = self._selected_widget
+        if previous is not None:
+            self._selected_widget = None
+            if previous.is_selectable:
+                previous.select(None)
 
         if index is not None:
             if index >= len(self.selectables) is None:
@@ -868,9 +1151,20 @@ class Container(Widget):
 
             widget, inner_index = self.selectables[index]
             widget.select(inner_index)
+            self._selected_widget = widget
 
         self.selected_index = index
 
+    def _recenter(self, *_: Any) -> None:
+        """Center again on the stored axis after a resize
+
+        Nested Containers are skipped, as their parent positions them on
+        its next `get_lines` call anyways. Centering them here would only
+        render their contents once more."""
+
+        if self.parent is None:
+            self.center(self._centered_axis)
+
     def center(
         self, where: CenteringPolicy | None = None, store: bool = True
     ) -> Container:
@@ -935,6 +1229,10 @@ class Container(Widget):
 
         handled = target_widget.handle_mouse(event, target)
         if handled:
+            # The widget may have selected itself, which `select` doesn't know
+            # about. Its target might not map to the same selectable.
+            if target_widget.is_selectable:
+                target_widget.select(None)
             self.select(self.mouse_targets.index(target))
 
         return handled
@@ -945,7 +1243,7 @@ class Container(Widget):
         def _is_nav(key: str) -> bool:
             """Determine if a key is in the navigation sets"""
 
-            return key in self.keys["next"] | self.keys["previous"]
+            return key in self.keys["next"] or key in self.keys["previous"]
 
         if self.selected is not None and self.selected.handle_key(key):
             return True
@@ -989,9 +1287,19 @@ class Container(Widget):
     def wipe(self) -> None:
         """Wipe characters occupied by the object"""
 
-        with cursor_at(self.pos) as print_here:
-            for line in self.get_lines():
-                print_here(real_length(line) * " ")
+        posx, posy = self.pos
+
+        with batched():
+            save_cursor()
+            write(
+                "".join(
+                    f"\x1b[{posy + i};{posx}H " + _real_length(line) * " "
+                    for i, line in enumerate(self.get_lines())
+                )
+            )
+            restore_cursor()
+
+        self._printed_lines = []
 
     def show_targets(self, color: Optional[int] = None) -> None:
         """Show all mouse targets of this Widget"""
@@ -1004,32 +1312,63 @@ class Container(Widget):
     def print(self) -> None:
         """Print object"""
 
-        if not terminal.size == self._prev_screen:
-            clear()
-            self.center(self._centered_axis)
+        self._print_lines(diff=False)
 
-        self._prev_screen = terminal.size
+    def print_changes(self) -> None:
+        """Print only the lines that changed since the previous print
 
-        if self.allow_fullscreen:
-            self.pos = terminal.origin
+        Everything is reprinted if the object moved or the screen was cleared
+        since. Use this in redraw loops where nothing else draws over the
+        object, as any such output is not noticed."""
+
+        self._print_lines(diff=True)
+
+    def _print_lines(self, diff: bool) -> None:
+        """Print object, skipping lines unchanged since the last print if `diff`"""
+
+        with batched():
+            if not terminal.size == self._prev_screen:
+                clear()
+                self.center(self._centered_axis)
+
+            self._prev_screen = terminal.size
+
+            if self.allow_fullscreen:
+                self.pos = terminal.origin
 
-        with cursor_at(self.pos) as print_here:
-            for line in self.get_lines():
-                print_here(line)
+            lines = self.get_lines()
+            state = (self.pos, terminal.clear_count)
+
+            previous: list[str] = []
+            if diff and self._printed_state == state:
+                previous = self._printed_lines
+
+            posx, posy = self.pos
+
+            # Every changed line is moved to & printed in one write, with the
+            # leading space `print_to` would add.
+            save_cursor()
+            write(
+                "".join(
+                    f"\x1b[{posy + i};{posx}H {line}"
+                    for i, line in enumerate(lines)
+                    if i >= len(previous) or previous[i] != line
+                )
+            )
+            restore_cursor()
+
+            self._printed_lines = lines
+            self._printed_state = state
 
         self._has_printed = True
 
     def debug(self) -> str:
         """Return debug information about this object's widgets"""
 
-        out = "Container("
-        for widget in self._widgets:
-            out += widget.debug() + ", "
-
-        out = out.strip(", ")
-        out += ", **attrs)"
+        args = [widget.debug() for widget in self._widgets]
+        args.append("**attrs")
 
-        return out
+        return "Container(" + ", ".join(args) + ")"
 
 
 class Label(Widget):
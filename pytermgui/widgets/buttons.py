@@ -79,7 +79,7 @@ class Button(Widget):
 
         self.mouse_targets = []
         label_style = self.get_style("label")
-        delimiters = self.get_char("delimiter")
+        delimiters = self.chars["delimiter"]
         highlight_style = self.get_style("highlight")
 
         assert isinstance(delimiters, list) and len(delimiters) == 2
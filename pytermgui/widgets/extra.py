@@ -55,7 +55,7 @@ class ColorPicker(Container):
     def get_lines(self) -> list[str]:
         """Get color table lines"""
 
-        chars = self.get_char("border")
+        chars = self.chars["border"]
         assert isinstance(chars, list)
         left_border, _, right_border, _ = chars
 
@@ -147,7 +147,7 @@ class Splitter(Container):
 
             widget.pos = (
                 self.pos[0] + padding + total_offset + error,
-                self.pos[1] + (1 if type(widget).__name__ == "Container" else 0),
+                self.pos[1] + (1 if type(widget) is Container else 0),
             )
 
             if aligned is not None:
@@ -163,6 +163,8 @@ class Splitter(Container):
         for target in self.mouse_targets:
             target.adjust()
 
+        self._last_hit = None
+
         return lines
 
     def debug(self) -> str:
@@ -371,6 +373,19 @@ class Slider(Widget):
             return 0
         return 1
 
+    @property
+    def locked(self) -> bool:
+        """Get locked state"""
+
+        return self._locked
+
+    @locked.setter
+    def locked(self, value: bool) -> None:
+        """Set locked state, which also decides if Slider is selectable"""
+
+        self._locked = value
+        self._invalidate_selectables()
+
     @property
     def value(self) -> float:
         """Get float value"""